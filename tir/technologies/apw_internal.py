@@ -16,7 +16,7 @@ from selenium.webdriver.common.keys  import  Keys
 
 # Importações da classe base
 # Importations from base class
-from tir.technologies.core.base import Base
+from tir.technologies.core.base import Base, label_pattern
 from tir.technologies.core.config import ConfigLoader
 from tir.technologies.core import enumerations as enum
 from tir.technologies.core.third_party.xpath_soup import xpath_soup
@@ -708,7 +708,7 @@ class ApwInternal(Base):
 
         >>> self.find_label_element("User:", container_object)
         """
-        element = next(iter(list(map(lambda x: self.find_first_div_parent(x), container.find_all(text=re.compile(f"^{re.escape(label_text)}" + r"(\*?)(\s*?)$"))))), None)
+        element = self.find_first_div_parent(container.find(text=label_pattern(label_text)))
         if element is None:
             return []
 
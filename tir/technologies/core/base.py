@@ -1,12 +1,11 @@
 import re
-import time
 import unittest
-import inspect
 import socket
 import sys
 import os
-import random
 import string
+import functools
+import pkgutil
 from selenium import webdriver
 from selenium.webdriver.common.keys import Keys
 from bs4 import BeautifulSoup
@@ -24,8 +23,34 @@ from selenium.webdriver.firefox.options import Options as FirefoxOpt
 from selenium.webdriver.chrome.options import Options as ChromeOpt
 from selenium.common.exceptions import StaleElementReferenceException
 from selenium.common.exceptions import WebDriverException
+from selenium.common.exceptions import TimeoutException
 from tir.technologies.core.third_party.screen_size import size
 
+ZINDEX_PATTERN = re.compile(r"z-index:\s*(-?\d+)")
+IS_DISPLAYED_JS = pkgutil.get_data('selenium.webdriver.remote', 'isDisplayed.js').decode('utf8')
+
+@functools.lru_cache(maxsize=256)
+def label_pattern(label_text, suffix=r"(\*?)(\s*?)$"):
+    """
+    Returns the compiled regex that matches a text starting with label_text followed by suffix.
+
+    The patterns are memoized, so searching repeatedly for the same label doesn't rebuild them.
+
+    :param label_text: The label text, matched literally
+    :type label_text: str
+    :param suffix: The regex appended after the escaped label text. - **Default:** r"(\*?)(\s*?)$"
+    :type suffix: str
+
+    :return: The compiled pattern
+    :rtype: re.Pattern
+
+    Usage:
+
+    >>> #Calling the function
+    >>> pattern = label_pattern("User:")
+    """
+    return re.compile(f"^{re.escape(label_text)}" + suffix)
+
 class Base(unittest.TestCase):
     """
     Base class for any technology to implement Selenium Interface Tests.
@@ -55,6 +80,10 @@ class Base(unittest.TestCase):
 
         base_container: A variable to contain the layer element to be used on all methods.
 
+        dom_cache: A tuple with the signature of the last page source and its parsed BeautifulSoup object.
+
+        xpath_cache: A dictionary with the xpaths already computed for elements of the parsed DOM.
+
         errors: A list that contains every error that should be sent to log at the end of the execution.
 
         language: Contains the terms defined in the language defined in config or found in the page.
@@ -65,6 +94,8 @@ class Base(unittest.TestCase):
 
         log_file: A variable to control when to generate a log file of each execution of web_scrap. (Debug purposes)
 
+        log_file_count: A counter used to name the log files generated by web_scrap.
+
         wait: The global Selenium Wait defined to be used in the entire application.
         """
         #Global Variables:
@@ -85,8 +116,11 @@ class Base(unittest.TestCase):
             self.log.user = getpass.getuser()
 
         self.base_container = "body"
+        self._dom_cache = None
+        self._xpath_cache = {}
         self.errors = []
         self.config.log_file = False
+        self.log_file_count = 0
 
         if autostart:
             self.Start()
@@ -109,7 +143,7 @@ class Base(unittest.TestCase):
         """
         expected_assert = expected
         msg = "Passed"
-        stack_item = next(iter(list(map(lambda x: x.function, filter(lambda x: re.search('test_', x.function), inspect.stack())))), None)
+        stack_item = self.get_test_function()
         test_number = f"{stack_item.split('_')[-1]} -" if stack_item else ""
         log_message = f"{test_number}"
         self.log.set_seconds()
@@ -117,8 +151,7 @@ class Base(unittest.TestCase):
         if self.errors:
             expected = not expected
 
-            for field_msg in self.errors:
-                log_message += (" " + field_msg)
+            log_message += " " + " ".join(self.errors)
 
             msg = log_message
 
@@ -159,16 +192,18 @@ class Base(unittest.TestCase):
         >>> #Calling the method
         >>> self.click(element(), click_type=enum.ClickType.JS)
         """
+        self._dom_cache = None
         try:
             if right_click:
                 ActionChains(self.driver).context_click(element).click().perform()
             else:
-                self.scroll_to_element(element)
                 if click_type == enum.ClickType.JS:
-                    self.driver.execute_script("arguments[0].click()", element)
+                    self.driver.execute_script("arguments[0].scrollIntoView(); arguments[0].click();", element)
                 elif click_type == enum.ClickType.SELENIUM:
+                    self.scroll_to_element(element)
                     element.click()
                 elif click_type == enum.ClickType.ACTIONCHAINS:
+                    self.scroll_to_element(element)
                     ActionChains(self.driver).move_to_element(element).click().perform()
             
             return True
@@ -219,6 +254,7 @@ class Base(unittest.TestCase):
         >>> #Calling the method
         >>> self.double_click(element())
         """
+        self._dom_cache = None
         try:
             if click_type == enum.ClickType.SELENIUM:
                 self.scroll_to_element(element)
@@ -278,18 +314,16 @@ class Base(unittest.TestCase):
                 by = By.XPATH
 
             if scrap_type != enum.ScrapType.XPATH:
-                soup = self.get_current_DOM()
                 container_selector = self.base_container
                 if (main_container is not None):
                     container_selector = main_container
-                containers = self.zindex_sort(soup.select(container_selector), reverse=True)
-                container = next(iter(containers), None)
-                if not container:
-                    return False
 
                 try:
-                    container_element = self.driver.find_element_by_xpath(xpath_soup(container))
-                except:
+                    container_element = self.get_top_container(container_selector)
+                except WebDriverException:
+                    return False
+
+                if not container_element:
                     return False
             else:
                 container_element = self.driver
@@ -313,6 +347,9 @@ class Base(unittest.TestCase):
 
         Receives a BeautifulSoup element list and filters only the displayed elements.
 
+        The visibility of every element is checked in the browser with a single script call. The script
+        runs Selenium's isDisplayed atom, the same one WebElement.is_displayed uses, on each element.
+
         :param elements: BeautifulSoup element list
         :type elements: List of BeautifulSoup objects
         :param reverse: Boolean value if order should be reversed or not. - **Default:** False
@@ -329,21 +366,27 @@ class Base(unittest.TestCase):
         >>> #Calling the method
         >>> self.filter_displayed_elements(elements, True)
         """
-        #0 - elements filtered
-        elements = list(filter(lambda x: self.soup_to_selenium(x) is not None ,elements ))
+        script = """
+        var isDisplayed = (%s);
+
+        var getDisplayedMask = (xpaths) => {
+            return xpaths.map((xpath) => {
+                var node = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+                return node !== null && isDisplayed(node);
+            });
+        }
+
+        return getDisplayedMask(arguments[0])
+        """ % IS_DISPLAYED_JS
+        #0 - Discard empty entries
+        elements = list(filter(lambda x: x is not None, elements)) if elements else []
         if not elements:
             return
-        #1 - Create an enumerated list from the original elements
-        indexed_elements = list(enumerate(elements))
-        #2 - Convert every element from the original list to selenium objects
-        selenium_elements = list(map(lambda x : self.soup_to_selenium(x), elements))
-        #3 - Create an enumerated list from the selenium objects
-        indexed_selenium_elements = list(enumerate(selenium_elements))
-        #4 - Filter elements based on "is_displayed()" and gets the filtered elements' enumeration
-        filtered_selenium_indexes = list(map(lambda x: x[0], filter(lambda x: x[1].is_displayed(), indexed_selenium_elements)))
-        #5 - Use List Comprehension to build a filtered list from the elements based on enumeration
-        filtered_elements = [x[1] for x in indexed_elements if x[0] in filtered_selenium_indexes]
-        #6 - Sort the result and return it
+        #1 - Evaluate the visibility of every element in one round-trip
+        mask = self.driver.execute_script(script, list(map(lambda x: self.soup_xpath(x), elements)))
+        #2 - Build a filtered list from the elements based on the mask
+        filtered_elements = [element for element, displayed in zip(elements, mask) if displayed]
+        #3 - Sort the result and return it
         return self.zindex_sort(filtered_elements, reverse)
 
     def find_first_div_parent(self, element):
@@ -397,7 +440,7 @@ class Base(unittest.TestCase):
 
         >>> self.find_label_element("User:", container_object)
         """
-        element = next(iter(list(map(lambda x: self.find_first_div_parent(x), container.find_all(text=re.compile(f"^{re.escape(label_text)}" + r"(\*?)(\s*?)$"))))), None)
+        element = self.find_first_div_parent(container.find(text=label_pattern(label_text)))
         if element is None:
             return []
 
@@ -413,6 +456,8 @@ class Base(unittest.TestCase):
 
         Returns current HTML DOM parsed as a BeautifulSoup object
 
+        The parsed DOM is cached and reused while the page source remains the same.
+
         :returns: BeautifulSoup parsed DOM
         :rtype: BeautifulSoup object
 
@@ -423,9 +468,16 @@ class Base(unittest.TestCase):
         """
         try:
 
-            soup = BeautifulSoup(self.driver.page_source,"html.parser")
+            page_source = self.driver.page_source
+            signature = (len(page_source), hash(page_source))
 
-            if soup and soup.select('.session'):
+            if self._dom_cache and self._dom_cache[0] == signature:
+                return self._dom_cache[1]
+
+            self._xpath_cache = {}
+            soup = BeautifulSoup(page_source,"html.parser")
+
+            if soup and "session" in page_source and soup.select('.session'):
 
                 script = """
                 var getIframe = () => {
@@ -442,10 +494,13 @@ class Base(unittest.TestCase):
                 """
                 soup = BeautifulSoup(self.driver.execute_script(script),'html.parser')
                 self.driver.switch_to.frame(self.driver.find_element_by_css_selector("iframe[class=session]"))
+            else:
+                self._dom_cache = (signature, soup)
 
             return soup
             
         except WebDriverException as e:
+            self._dom_cache = None
             self.driver.switch_to.default_content()
             soup = BeautifulSoup(self.driver.page_source,"html.parser")
             return soup
@@ -500,6 +555,69 @@ class Base(unittest.TestCase):
             print("********Element Stale get_element_value*********")
             pass
 
+    def get_test_function(self):
+        """
+        [Internal]
+
+        Returns the name of the first function in the call stack that contains "test_".
+
+        The frames are walked directly, so the source lines of the stack are never read.
+
+        :return: The test function name or None if it isn't in the call stack.
+        :rtype: str
+
+        Usage:
+
+        >>> #Calling the method
+        >>> test_function = self.get_test_function()
+        """
+        frame = sys._getframe(1)
+        while frame:
+            if "test_" in frame.f_code.co_name:
+                return frame.f_code.co_name
+            frame = frame.f_back
+        return None
+
+    def get_top_container(self, container_selector):
+        """
+        [Internal]
+
+        Returns the container with the highest z-index among the elements that match the selector.
+
+        The search runs in the browser, so the DOM doesn't need to be parsed to locate the container.
+        The z-index is read from the inline style, the same rule used by search_zindex, so the container
+        picked here is the same one zindex_sort puts first.
+
+        :param container_selector: The CSS selector of the containers
+        :type container_selector: str
+
+        :return: The topmost container or None if no element matches the selector
+        :rtype: Selenium object
+
+        Usage:
+
+        >>> #Calling the method
+        >>> container = self.get_top_container(".tmodaldialog,.ui-dialog")
+        """
+        script = """
+        var getTopContainer = (selector) => {
+            var top = null;
+            var topIndex = 0;
+            document.querySelectorAll(selector).forEach((node) => {
+                var match = /z-index:\\s*(-?\\d+)/.exec(node.getAttribute("style") || "");
+                var zindex = match ? parseInt(match[1]) : 0;
+                if (top === null || zindex > topIndex) {
+                    top = node;
+                    topIndex = zindex;
+                }
+            });
+            return top;
+        }
+
+        return getTopContainer(arguments[0])
+        """
+        return self.driver.execute_script(script, container_selector)
+
     def log_error(self, message, new_log_line=True):
         """
         [Internal]
@@ -516,7 +634,7 @@ class Base(unittest.TestCase):
         >>> #Calling the method:
         >>> self.log_error("Element was not found")
         """
-        stack_item = next(iter(list(map(lambda x: x.function, filter(lambda x: re.search('test_', x.function), inspect.stack())))), None)
+        stack_item = self.get_test_function()
         test_number = f"{stack_item.split('_')[-1]} -" if stack_item else ""
         log_message = f"{test_number} {message}"
         self.log.set_seconds()
@@ -645,12 +763,15 @@ class Base(unittest.TestCase):
         Usage:
 
         >>> #Line extracted from zindex_sort method:
-        >>> elements.sort(key=lambda x: self.search_zindex(x), reverse=reverse)
+        >>> elements.sort(key=self.search_zindex, reverse=reverse)
 
         """
         zindex = 0
-        if hasattr(element,"attrs") and "style" in element.attrs and "z-index:" in element.attrs['style']:
-            zindex = int(element.attrs['style'].split("z-index:")[1].split(";")[0].strip())
+        style = element.attrs.get("style") if hasattr(element,"attrs") else None
+        if style:
+            match = ZINDEX_PATTERN.search(style)
+            if match:
+                zindex = int(match.group(1))
 
         return zindex
 
@@ -658,6 +779,8 @@ class Base(unittest.TestCase):
         """
         Selects the option on the combobox.
 
+        Waits up to 5 seconds for the option to be available and for the selection to be applied.
+
         :param element: Combobox element
         :type element: Beautiful Soup object
         :param option: Option to be selected
@@ -668,20 +791,67 @@ class Base(unittest.TestCase):
         >>> #Calling the method:
         >>> self.select_combo(element, "Chosen option")
         """
-        combo = Select(self.driver.find_element_by_xpath(xpath_soup(element)))
-        value = next(iter(filter(lambda x: x.text[0:len(option)] == option, combo.options)), None)
+        self._dom_cache = None
+        combo = Select(self.driver.find_element_by_xpath(self.soup_xpath(element)))
+        find_option = lambda: next(iter(filter(lambda x: x.text[0:len(option)] == option, combo.options)), None)
+
+        try:
+            value = WebDriverWait(self.driver, 5).until(lambda driver: find_option())
+        except TimeoutException:
+            value = None
 
         if value:
-            time.sleep(1)
             text_value = value.text
             combo.select_by_visible_text(text_value)
+            try:
+                WebDriverWait(self.driver, 5).until(lambda driver: combo.first_selected_option.text == text_value)
+            except TimeoutException:
+                print(f"Warning select_combo: {text_value} wasn't reflected as the selected option")
             print(f"Selected value for combo is: {text_value}")
 
+    def select_by_text(self, container, selector, term):
+        """
+        [Internal]
+
+        Returns the elements that match the selector inside the container and contain the term in their text.
+
+        The comparison is case insensitive. If the container text doesn't contain the term, none of the
+        elements are checked.
+
+        :param container: The container to be searched
+        :type container: BeautifulSoup object
+        :param selector: The CSS selector of the elements
+        :type selector: str
+        :param term: The text to be searched
+        :type term: str
+
+        :return: List of BeautifulSoup elements that contain the term
+        :rtype: List of BeautifulSoup objects
+
+        Usage:
+
+        >>> #Calling the method:
+        >>> elements = self.select_by_text(container, ".tsay", "Example")
+        """
+        term = term.lower()
+        if term not in container.text.lower():
+            return []
+
+        return list(filter(lambda x: term in x.text.lower(), container.select(selector)))
+
     def send_keys(self, element, arg):
         """
         [Internal]
 
-        Clicks two times on the Selenium element.
+        Sends text or keys to the Selenium element.
+
+        Text replaces the current content of the element in a single ActionChain, which moves the caret
+        to the start before typing so masked inputs are filled from their first position. Keys are sent
+        directly to the element, falling back to an ActionChain if the element rejects them.
+
+        The ActionChain clicks the centre of the element and types into whatever has the focus. If an
+        overlay or a tooltip covers the field, the text goes elsewhere without raising, so the fallback
+        to the element itself doesn't run.
 
         :param element: Selenium element
         :type element: Selenium object
@@ -697,20 +867,30 @@ class Base(unittest.TestCase):
         >>> #Calling the method with a Key
         >>> self.send_keys(element(), Keys.ENTER)
         """
+        self._dom_cache = None
         try:
             if arg.isprintable():
-                element.clear()
-                element.send_keys(Keys.CONTROL, 'a')
-            element.send_keys(arg)
+                actions = ActionChains(self.driver)
+                actions.move_to_element(element)
+                actions.click()
+                actions.key_down(Keys.CONTROL).send_keys('a').key_up(Keys.CONTROL).send_keys(Keys.DELETE)
+                actions.send_keys(Keys.HOME)
+                actions.send_keys(arg)
+                actions.perform()
+            else:
+                element.send_keys(arg)
         except Exception:
-            actions = ActionChains(self.driver)
-            actions.move_to_element(element)
-            actions.click()
             if arg.isprintable():
-                actions.key_down(Keys.CONTROL).send_keys('a').key_up(Keys.CONTROL).send_keys(Keys.DELETE)
-            actions.send_keys(Keys.HOME)
-            actions.send_keys(arg)
-            actions.perform()
+                element.clear()
+                element.send_keys(Keys.CONTROL, 'a')
+                element.send_keys(arg)
+            else:
+                actions = ActionChains(self.driver)
+                actions.move_to_element(element)
+                actions.click()
+                actions.send_keys(Keys.HOME)
+                actions.send_keys(arg)
+                actions.perform()
 
     def search_stack(self, function):
         """
@@ -727,7 +907,12 @@ class Base(unittest.TestCase):
         >>> # Calling the method:
         >>> is_present = self.search_stack("MATA020")
         """
-        return len(list(filter(lambda x: x.function == function, inspect.stack()))) > 0
+        frame = sys._getframe(1)
+        while frame:
+            if frame.f_code.co_name == function:
+                return True
+            frame = frame.f_back
+        return False
 
     def set_element_focus(self, element):
         """
@@ -752,6 +937,31 @@ class Base(unittest.TestCase):
             pass
     
 
+    def soup_xpath(self, soup_object):
+        """
+        [Internal]
+
+        Returns the xpath of a BeautifulSoup object, reusing the value already computed for the same object.
+
+        The cache is emptied every time a new DOM is parsed.
+
+        :param soup_object: The BeautifulSoup object
+        :type soup_object: BeautifulSoup object
+
+        :return: The absolute xpath of the object
+        :rtype: str
+
+        Usage:
+
+        >>> # Calling the method:
+        >>> xpath = self.soup_xpath(bs_obj)
+        """
+        entry = self._xpath_cache.get(id(soup_object))
+        if entry is None or entry[0] is not soup_object:
+            entry = (soup_object, xpath_soup(soup_object))
+            self._xpath_cache[id(soup_object)] = entry
+        return entry[1]
+
     def soup_to_selenium(self, soup_object):
         """
         [Internal]
@@ -771,7 +981,36 @@ class Base(unittest.TestCase):
         """
         if soup_object is None:
             raise AttributeError
-        return next(iter(self.driver.find_elements_by_xpath(xpath_soup(soup_object))), None)
+        return next(iter(self.driver.find_elements_by_xpath(self.soup_xpath(soup_object))), None)
+
+    def soups_to_selenium(self, soup_objects):
+        """
+        [Internal]
+
+        Converts a list of BeautifulSoup objects to Selenium objects with a single script call.
+
+        :param soup_objects: The BeautifulSoup objects to be converted.
+        :type soup_objects: List of BeautifulSoup objects
+
+        :return: The objects converted to Selenium objects, in the same order. Elements not found are None.
+        :rtype: List of Selenium objects
+
+        Usage:
+
+        >>> # Calling the method:
+        >>> selenium_objects = self.soups_to_selenium(soup.select("button"))
+        """
+        if not soup_objects:
+            return []
+
+        script = """
+        var evaluateXpaths = (xpaths) => {
+            return xpaths.map((xpath) => document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue);
+        }
+
+        return evaluateXpaths(arguments[0])
+        """
+        return self.driver.execute_script(script, list(map(lambda x: self.soup_xpath(x), soup_objects)))
 
     def web_scrap(self, term, scrap_type=enum.ScrapType.TEXT, optional_term=None, label=False, main_container=None):
         """
@@ -779,6 +1018,9 @@ class Base(unittest.TestCase):
 
         Returns a BeautifulSoup object list based on the search parameters.
 
+        Waits up to 60 seconds for the container, parsing the DOM only when the browser reports it
+        (or the .session iframe, whose content is parsed until the container shows up inside it).
+
         Does not support ScrapType.XPATH as scrap_type parameter value.
 
         :param term: The first search term. A text or a selector
@@ -807,35 +1049,39 @@ class Base(unittest.TestCase):
         >>> elements = self.web_scrap(term="my_text", scrap_type=ScrapType.MIXED, optional_term=".my_class")
         """
         try:
-            endtime = time.time() + 60
-            container =  None
-            while(time.time() < endtime and container is None):
-                soup = self.get_current_DOM()
-
-                if self.config.log_file:
-                    with open(f"{term + str(scrap_type) + str(optional_term) + str(label) + str(main_container) + str(random.randint(1, 101)) }.txt", "w") as text_file:
-                        text_file.write(f" HTML CONTENT: {str(soup)}")
-
-                container_selector = self.base_container
-                if (main_container is not None):
-                    container_selector = main_container
+            container_selector = self.base_container
+            if (main_container is not None):
+                container_selector = main_container
 
-                containers = self.zindex_sort(soup.select(container_selector), reverse=True)
+            def find_container(driver):
+                if not (driver.find_elements(By.CSS_SELECTOR, container_selector) or driver.find_elements(By.CSS_SELECTOR, "iframe.session")):
+                    return None
+                soup = self.get_current_DOM()
+                container = next(iter(self.zindex_sort(soup.select(container_selector), reverse=True)), None)
+                return (soup, container) if container else None
 
-                container = next(iter(containers), None)
+            try:
+                soup, container = WebDriverWait(self.driver, 60).until(find_container)
+            except TimeoutException:
+                container = None
 
             if container is None:
                 raise Exception("Couldn't find container")
 
+            if self.config.log_file:
+                self.log_file_count += 1
+                with open(f"{term + str(scrap_type) + str(optional_term) + str(label) + str(main_container) + str(self.log_file_count)}.txt", "w") as text_file:
+                    text_file.write(f" HTML CONTENT: {str(soup)}")
+
             if (scrap_type == enum.ScrapType.TEXT):
                 if label:
                     return self.find_label_element(term, container)
                 else:
-                    return list(filter(lambda x: term.lower() in x.text.lower(), container.select("div > *")))
+                    return self.select_by_text(container, "div > *", term)
             elif (scrap_type == enum.ScrapType.CSS_SELECTOR):
                 return container.select(term)
             elif (scrap_type == enum.ScrapType.MIXED and optional_term is not None):
-                return list(filter(lambda x: term.lower() in x.text.lower(), container.select(optional_term)))
+                return self.select_by_text(container, optional_term, term)
             elif (scrap_type == enum.ScrapType.SCRIPT):
                 script_result = self.driver.execute_script(term)
                 return script_result if isinstance(script_result, list) else []
@@ -868,7 +1114,7 @@ class Base(unittest.TestCase):
         >>> #Calling the method
         >>> self.zindex_sort(elements, True)
         """
-        elements.sort(key=lambda x: self.search_zindex(x), reverse=reverse)
+        elements.sort(key=self.search_zindex, reverse=reverse)
         return elements
 
 # User Methods
@@ -1,6 +1,5 @@
 from tir.technologies.core.base import Base
 from tir.technologies.webapp_internal import WebappInternal
-import pandas as pd
 import pyodbc
 import re
 
@@ -128,6 +127,7 @@ class BaseDatabase(Base):
         connection = self.connect_database(query, database_driver, dbq_oracle_server, database_server, database_port, database_name, database_user, database_password)
         
         if re.findall(r'^(SELECT)', query.upper()):
+            import pandas as pd
             df = pd.read_sql(sql=query, con=connection)
             return (df.to_dict())
         elif re.findall(r'^(UPDATE|DELETE|INSERT)', query.upper()):
@@ -1,11 +1,9 @@
 import time
 import os
-import numpy as nump
-import pandas as panda
 import uuid
 import csv
 import inspect
-import re
+import sys
 from datetime import datetime
 from tir.technologies.core.config import ConfigLoader
 
@@ -153,7 +151,13 @@ class Log:
         Returns a string with the current testcase name
         [Internal]
         """
-        return next(iter(list(map(lambda x: x.function, filter(lambda x: re.search('setUpClass', x.function) or re.search('test_', x.function), inspect.stack())))), None)
+        frame = sys._getframe(1)
+        while frame:
+            function = frame.f_code.co_name
+            if "setUpClass" in function or "test_" in function:
+                return function
+            frame = frame.f_back
+        return None
 
     def checks_empty_line(self):
         """
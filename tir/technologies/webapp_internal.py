@@ -1,9 +1,7 @@
 import re
 import time
-import pandas as pd
 import inspect
 import os
-import random
 import uuid
 from functools import reduce
 from selenium.webdriver.common.keys import Keys
@@ -16,8 +14,7 @@ import tir.technologies.core.enumerations as enum
 from tir.technologies.core.log import Log
 from tir.technologies.core.config import ConfigLoader
 from tir.technologies.core.language import LanguagePack
-from tir.technologies.core.third_party.xpath_soup import xpath_soup
-from tir.technologies.core.base import Base
+from tir.technologies.core.base import Base, label_pattern
 from tir.technologies.core.numexec import NumExec
 from math import sqrt, pow
 from selenium.common.exceptions import *
@@ -453,7 +450,7 @@ class WebappInternal(Base):
             self.log_error(message)
             raise ValueError(message)
 
-        button = lambda: self.driver.find_element_by_xpath(xpath_soup(button_element))
+        button = lambda: self.driver.find_element_by_xpath(self.soup_xpath(button_element))
         self.click(button())
 
     def reload_user_screen(self):
@@ -512,7 +509,7 @@ class WebappInternal(Base):
             self.log_error(message)
             raise ValueError(message)
 
-        date = lambda: self.driver.find_element_by_xpath(xpath_soup(base_date))
+        date = lambda: self.driver.find_element_by_xpath(self.soup_xpath(base_date))
         self.double_click(date())
         self.send_keys(date(), Keys.HOME)
         self.send_keys(date(), self.config.date)
@@ -530,7 +527,7 @@ class WebappInternal(Base):
             self.log_error(message)
             raise ValueError(message)
         
-        group = lambda: self.driver.find_element_by_xpath(xpath_soup(group_element))
+        group = lambda: self.driver.find_element_by_xpath(self.soup_xpath(group_element))
         self.double_click(group())
         self.send_keys(group(), Keys.HOME)
         self.send_keys(group(), self.config.group)
@@ -547,7 +544,7 @@ class WebappInternal(Base):
             self.log_error(message)
             raise ValueError(message)
 
-        branch = lambda: self.driver.find_element_by_xpath(xpath_soup(branch_element))
+        branch = lambda: self.driver.find_element_by_xpath(self.soup_xpath(branch_element))
         self.double_click(branch())
         self.send_keys(branch(), Keys.HOME)
         self.send_keys(branch(), self.config.branch)
@@ -565,7 +562,7 @@ class WebappInternal(Base):
             raise ValueError(message)
 
 
-        env = lambda: self.driver.find_element_by_xpath(xpath_soup(environment_element))
+        env = lambda: self.driver.find_element_by_xpath(self.soup_xpath(environment_element))
         if ("disabled" not in environment_element.parent.attrs["class"] and env().is_enabled()):
             env_value = self.get_web_value(env())
             endtime = time.time() + self.config.time_out
@@ -580,7 +577,7 @@ class WebappInternal(Base):
         button_element = next(iter(buttons), None) if buttons else None
 
         if button_element  and hasattr(button_element, "name") and hasattr(button_element, "parent"):
-            button = lambda: self.driver.find_element_by_xpath(xpath_soup(button_element))
+            button = lambda: self.driver.find_element_by_xpath(self.soup_xpath(button_element))
             self.click(button())
         elif not change_env:
             self.restart_counter += 1
@@ -620,7 +617,7 @@ class WebappInternal(Base):
 
         element = self.change_environment_element_home_screen()
         if element:
-            self.click(self.driver.find_element_by_xpath(xpath_soup(element)))
+            self.click(self.driver.find_element_by_xpath(self.soup_xpath(element)))
             self.environment_screen(True)
         else:
             self.log_error("Change Envirioment method did not find the element to perform the click or the element was not visible on the screen.")
@@ -669,7 +666,7 @@ class WebappInternal(Base):
             if buttons:
                 close_button = next(iter(list(filter(lambda x: x.text == self.language.close, buttons))), None)
                 time.sleep(0.5)
-                selenium_close_button = lambda: self.driver.find_element_by_xpath(xpath_soup(close_button))
+                selenium_close_button = lambda: self.driver.find_element_by_xpath(self.soup_xpath(close_button))
                 if close_button:
                     try:
                         self.wait_until_to( expected_condition = "element_to_be_clickable", element = close_button , locator = By.XPATH)
@@ -863,8 +860,8 @@ class WebappInternal(Base):
                 if tget_img is None:
                     self.log_error("Couldn't find Program field.")
 
-                s_tget = lambda : self.driver.find_element_by_xpath(xpath_soup(tget_input))
-                s_tget_img = lambda : self.driver.find_element_by_xpath(xpath_soup(tget_img))
+                s_tget = lambda : self.driver.find_element_by_xpath(self.soup_xpath(tget_input))
+                s_tget_img = lambda : self.driver.find_element_by_xpath(self.soup_xpath(tget_img))
 
                 self.wait_until_to( expected_condition = "element_to_be_clickable", element = tget_input, locator = By.XPATH )
                 self.double_click(s_tget())
@@ -941,7 +938,7 @@ class WebappInternal(Base):
 
             print("Field successfully found")
             if(send_key):
-                input_field = lambda: self.driver.find_element_by_xpath(xpath_soup(element))
+                input_field = lambda: self.driver.find_element_by_xpath(self.soup_xpath(element))
                 self.set_element_focus(input_field())
                 container = self.get_current_container()
                 self.send_keys(input_field(), Keys.F3)
@@ -953,7 +950,7 @@ class WebappInternal(Base):
 
             container_end = self.get_current_container()
             if (container['id']  == container_end['id']):
-                input_field = lambda: self.driver.find_element_by_xpath(xpath_soup(element))
+                input_field = lambda: self.driver.find_element_by_xpath(self.soup_xpath(element))
                 self.set_element_focus(input_field())
                 self.send_keys(input_field(), Keys.F3)
             
@@ -1099,7 +1096,7 @@ class WebappInternal(Base):
         if index and not isinstance(search_key, int):
             self.log_error("If index parameter is True, key must be a number!")
 
-        sel_browse_key = lambda: self.driver.find_element_by_xpath(xpath_soup(search_elements[0]))
+        sel_browse_key = lambda: self.driver.find_element_by_xpath(self.soup_xpath(search_elements[0]))
         self.wait_element(term="[style*='fwskin_seekbar_ico']", scrap_type=enum.ScrapType.CSS_SELECTOR)
         self.wait_until_to( expected_condition = "element_to_be_clickable", element = search_elements[0], locator = By.XPATH)
         self.set_element_focus(sel_browse_key())
@@ -1140,7 +1137,7 @@ class WebappInternal(Base):
                 self.log_error("Key index out of range.")
             trb_input = tradiobuttonitens[search_key]
 
-            sel_input = lambda: self.driver.find_element_by_xpath(xpath_soup(trb_input))
+            sel_input = lambda: self.driver.find_element_by_xpath(self.soup_xpath(trb_input))
             self.wait_until_to( expected_condition = "element_to_be_clickable", element = trb_input, locator = By.XPATH )
             self.click(sel_input())
 
@@ -1168,7 +1165,7 @@ class WebappInternal(Base):
 
         if index and not isinstance(search_column, int):
             self.log_error("If index parameter is True, column must be a number!")
-        sel_browse_column = lambda: self.driver.find_element_by_xpath(xpath_soup(search_elements[0]))
+        sel_browse_column = lambda: self.driver.find_element_by_xpath(self.soup_xpath(search_elements[0]))
         self.wait_element(term="[style*='fwskin_seekbar_ico']", scrap_type=enum.ScrapType.CSS_SELECTOR)
         self.wait_until_to( expected_condition = "element_to_be_clickable", element = search_elements[0], locator = By.XPATH)
         self.set_element_focus(sel_browse_column())
@@ -1213,8 +1210,8 @@ class WebappInternal(Base):
         """
         self.wait_blocker()
         endtime = time.time() + self.config.time_out
-        sel_browse_input = lambda: self.driver.find_element_by_xpath(xpath_soup(search_elements[1]))
-        sel_browse_icon = lambda: self.driver.find_element_by_xpath(xpath_soup(search_elements[2]))
+        sel_browse_input = lambda: self.driver.find_element_by_xpath(self.soup_xpath(search_elements[1]))
+        sel_browse_icon = lambda: self.driver.find_element_by_xpath(self.soup_xpath(search_elements[2]))
 
         current_value = self.get_element_value(sel_browse_input())
 
@@ -1334,7 +1331,7 @@ class WebappInternal(Base):
                 container = self.get_current_container()
                 labels = container.select("label")
                 labels_displayed = list(filter(lambda x: self.element_is_displayed(x) ,labels))
-                labels_list  = list(filter(lambda x: re.search(r"^{}([^a-zA-Z0-9]+)?$".format(re.escape(field)),x.text) ,labels_displayed))
+                labels_list  = list(filter(lambda x: label_pattern(field, r"([^a-zA-Z0-9]+)?$").search(x.text) ,labels_displayed))
                 labels_list_filtered = list(filter(lambda x: 'th' not in self.element_name(x.parent.parent) , labels_list))
                 if labels_list_filtered and len(labels_list_filtered) -1 >= position:
                     label = labels_list_filtered[position]
@@ -1392,11 +1389,8 @@ class WebappInternal(Base):
         Return Height/Width
 
         """
-        script = f'return document.getElementById("{id}").offsetHeight;'
-        height = self.driver.execute_script(script)
-        script = f'return document.getElementById("{id}").offsetWidth;'
-        width  = self.driver.execute_script(script)
-        return {'height': height, 'width':width}
+        script = 'var element = document.getElementById(arguments[0]); return {"height": element.offsetHeight, "width": element.offsetWidth};'
+        return self.driver.execute_script(script, id)
 
 
     def SetValue(self, field, value, grid=False, grid_number=1, ignore_case=True, row=None, name_attr=False, position = 1, check_value=True):
@@ -1728,7 +1722,7 @@ class WebappInternal(Base):
             if not element:
                 self.log_error(f"Couldn't find element: {field}")
 
-            field_element = lambda: self.driver.find_element_by_xpath(xpath_soup(element))
+            field_element = lambda: self.driver.find_element_by_xpath(self.soup_xpath(element))
 
             endtime = time.time() + 10
             current_value =  ''
@@ -1798,7 +1792,7 @@ class WebappInternal(Base):
             while ( (time.time() < endtime) and (not element) and (not hasattr(element, "name")) and (not hasattr(element, "parent"))):           
                 element = self.get_field(field)
                 if ( hasattr(element, "name") and hasattr(element, "parent") ):
-                    selenium_element = lambda: self.driver.find_element_by_xpath(xpath_soup(element))
+                    selenium_element = lambda: self.driver.find_element_by_xpath(self.soup_xpath(element))
                     value = self.get_web_value(selenium_element())
         else:
             field_array = [line-1, field, "", grid_number-1]
@@ -2012,10 +2006,6 @@ class WebappInternal(Base):
                 if check_error:
                     self.search_for_errors(check_help)
 
-                if self.config.log_file:
-                    with open(f"{term + str(scrap_type) + str(optional_term) + str(label) + str(main_container) + str(random.randint(1, 101)) }.txt", "w") as text_file:
-                        text_file.write(f" HTML CONTENT: {str(soup)}")
-
                 container_selector = self.base_container
                 if (main_container is not None):
                     container_selector = main_container
@@ -2027,20 +2017,28 @@ class WebappInternal(Base):
 
                 container = next(iter(containers), None) if isinstance(containers, list) else container
 
+                if container is None:
+                    time.sleep(0.5)
+
             if container is None:
                 raise Exception(f"Web Scrap couldn't find container - term: {term}")
 
+            if self.config.log_file:
+                self.log_file_count += 1
+                with open(f"{term + str(scrap_type) + str(optional_term) + str(label) + str(main_container) + str(self.log_file_count)}.txt", "w") as text_file:
+                    text_file.write(f" HTML CONTENT: {str(soup)}")
+
             if (scrap_type == enum.ScrapType.TEXT):
                 if label:
                     return self.find_label_element(term, container) if self.find_label_element(term, container) else []
                 elif not re.match(r"\w+(_)", term):
                     return self.filter_label_element(term, container) if self.filter_label_element(term, container) else []
                 else:
-                    return list(filter(lambda x: term.lower() in x.text.lower(), container.select("div > *")))
+                    return self.select_by_text(container, "div > *", term)
             elif (scrap_type == enum.ScrapType.CSS_SELECTOR):
                 return container.select(term)
             elif (scrap_type == enum.ScrapType.MIXED and optional_term is not None):
-                return list(filter(lambda x: term.lower() in x.text.lower(), container.select(optional_term)))
+                return self.select_by_text(container, optional_term, term)
             elif (scrap_type == enum.ScrapType.SCRIPT):
                 script_result = self.driver.execute_script(term)
                 return script_result if isinstance(script_result, list) else []
@@ -2095,14 +2093,14 @@ class WebappInternal(Base):
         elif icon_error_log:
             label = reduce(lambda x,y: f"{x} {y}", map(lambda x: x.text.strip(), top_layer.select(".tsay label")))
             textarea = next(iter(top_layer.select("textarea")), None)
-            textarea_value = self.driver.execute_script(f"return arguments[0].value", self.driver.find_element_by_xpath(xpath_soup(textarea)))
+            textarea_value = self.driver.execute_script(f"return arguments[0].value", self.driver.find_element_by_xpath(self.soup_xpath(textarea)))
 
             error_paragraphs = textarea_value.split("\n\n")
             error_message = f"Error Log: {error_paragraphs[0]} - {error_paragraphs[1]}" if len(error_paragraphs) > 2 else label
             message = error_message.replace("\n", " ")
 
             button = next(iter(filter(lambda x: self.language.details.lower() in x.text.lower(),top_layer.select("button"))), None)
-            self.click(self.driver.find_element_by_xpath(xpath_soup(button)))
+            self.click(self.driver.find_element_by_xpath(self.soup_xpath(button)))
             time.sleep(1)
         self.restart_counter += 1
         self.log_error(message)
@@ -2207,11 +2205,6 @@ class WebappInternal(Base):
                 selector = f"[name*='{term}']"
 
             if scrap_type != enum.ScrapType.XPATH:
-                soup = self.get_current_DOM()
-
-                if not soup:
-                    return False
-
                 if check_error:
                     self.search_for_errors()
 
@@ -2220,28 +2213,12 @@ class WebappInternal(Base):
                     container_selector = main_container
 
                 try:
-                    containers_soup = soup.select(container_selector)
-
-                    if not containers_soup:
-                        return False
-
-                    containers = self.zindex_sort(containers_soup, reverse=True)
-
-                except Exception as e:
+                    container_element = self.get_top_container(container_selector)
+                except WebDriverException as e:
                     print(f"Warning element_exists containers exception:\n {str(e)}")
-                    pass
-
-                if self.base_container in container_selector:
-                    container = self.containers_filter(containers)
-
-                container = next(iter(containers), None) if isinstance(containers, list) else containers
-
-                if not container:
                     return False
 
-                try:
-                    container_element = self.driver.find_element_by_xpath(xpath_soup(container))
-                except:
+                if not container_element:
                     return False
             else:
                 container_element = self.driver
@@ -2310,8 +2287,8 @@ class WebappInternal(Base):
                     if time.time() > endtime and (not subMenuElements or len(subMenuElements) < self.children_element_count(".tmenu", ".tmenuitem")):
                         self.restart_counter += 1
                         self.log_error(f"Couldn't find menu item: {menuitem}")
-                child = list(filter(lambda x: x.text.startswith(menuitem) and EC.element_to_be_clickable((By.XPATH, xpath_soup(x))), subMenuElements))[0]
-                submenu = lambda: self.driver.find_element_by_xpath(xpath_soup(child))
+                child = list(filter(lambda x: x.text.startswith(menuitem) and EC.element_to_be_clickable((By.XPATH, self.soup_xpath(x))), subMenuElements))[0]
+                submenu = lambda: self.driver.find_element_by_xpath(self.soup_xpath(child))
                 if subMenuElements and submenu():
                     self.scroll_to_element(submenu())
                     self.wait_until_to( expected_condition = "element_to_be_clickable", element = child, locator = By.XPATH )
@@ -2780,7 +2757,7 @@ class WebappInternal(Base):
         """
         try:
             field = self.get_field("cPesq", name_attr=True)
-            element = lambda: self.driver.find_element_by_xpath(xpath_soup(field))
+            element = lambda: self.driver.find_element_by_xpath(self.soup_xpath(field))
             self.click(element())
             self.send_keys(element(), table)
             time.sleep(0.5)
@@ -2884,7 +2861,7 @@ class WebappInternal(Base):
             self.wait_element(term=self.language.invert_selection, scrap_type=enum.ScrapType.MIXED, optional_term="label span")
             element = next(iter(self.web_scrap(term="label.tcheckbox input", scrap_type=enum.ScrapType.CSS_SELECTOR)), None)
             if element:
-                box = lambda: self.driver.find_element_by_xpath(xpath_soup(element))
+                box = lambda: self.driver.find_element_by_xpath(self.soup_xpath(element))
                 self.click(box())
 
         elif select_all and not is_select_all_button:
@@ -2982,7 +2959,7 @@ class WebappInternal(Base):
             td_list_filtered  = list(filter(lambda x: x.text.strip() == match_value and self.element_is_displayed(x) ,td_list))
             td_element = next(iter(td_list_filtered), None)
 
-            if not td_element and next(self.scroll_grid_check_elements_change(xpath_soup(td_element_not_filtered))):
+            if not td_element and next(self.scroll_grid_check_elements_change(self.soup_xpath(td_element_not_filtered))):
                 actions.key_down(Keys.PAGE_DOWN).perform()
                 self.wait_element_is_not_displayed(td().parent)
 
@@ -3364,7 +3341,7 @@ class WebappInternal(Base):
                 self.scroll_to_element( self.soup_to_selenium(element) )
 
             try:
-                element = lambda: self.driver.find_element_by_xpath(xpath_soup(self.get_field(field)))
+                element = lambda: self.driver.find_element_by_xpath(self.soup_xpath(self.get_field(field)))
                 self.set_element_focus(element())
             except Exception as e:
                 print(f"Warning: SetFocus: '{field}' - Exception {str(e)}")
@@ -3419,7 +3396,7 @@ class WebappInternal(Base):
         if not input_element:
             self.log_error("Couldn't find input element")
 
-        xpath_input = lambda: self.driver.find_element_by_xpath(xpath_soup(input_element))
+        xpath_input = lambda: self.driver.find_element_by_xpath(self.soup_xpath(input_element))
 
         if input_element.attrs['type'] == "checkbox" and "checked" in input_element.parent.attrs['class']:
             return None
@@ -3713,7 +3690,7 @@ class WebappInternal(Base):
                         column_number = headers[field[2]][column_name]
 
                         current_value = columns[column_number].text.strip()
-                        xpath = xpath_soup(columns[column_number])
+                        xpath = self.soup_xpath(columns[column_number])
                         current_value = self.remove_mask(current_value).strip()
 
                         selenium_column = lambda: self.get_selenium_column_element(xpath) if self.get_selenium_column_element(xpath) else self.try_recover_lost_line(field, grid_id, row, headers, field_to_label)
@@ -3758,8 +3735,8 @@ class WebappInternal(Base):
                         if child_type == "input":
 
                             time.sleep(2)
-                            selenium_input = lambda: self.driver.find_element_by_xpath(xpath_soup(child[0]))
-                            self.wait_element(term=xpath_soup(child[0]), scrap_type=enum.ScrapType.XPATH)
+                            selenium_input = lambda: self.driver.find_element_by_xpath(self.soup_xpath(child[0]))
+                            self.wait_element(term=self.soup_xpath(child[0]), scrap_type=enum.ScrapType.XPATH)
                             valtype = selenium_input().get_attribute("valuetype")
                             lenfield = len(self.get_element_value(selenium_input()))
                             user_value = field[1]
@@ -3802,7 +3779,7 @@ class WebappInternal(Base):
                                     
                             try_endtime = self.config.time_out / 4
                             while try_endtime > 0:
-                                element_exist = self.wait_element_timeout(term=xpath_soup(child[0]), scrap_type=enum.ScrapType.XPATH, timeout = 10, presence=False)
+                                element_exist = self.wait_element_timeout(term=self.soup_xpath(child[0]), scrap_type=enum.ScrapType.XPATH, timeout = 10, presence=False)
                                 time.sleep(1)
                                 if element_exist:
                                     current_value = self.get_element_text(selenium_column())
@@ -3818,7 +3795,7 @@ class WebappInternal(Base):
                         else:
                             option_text_list = list(filter(lambda x: field[1] == x[0:len(field[1])], map(lambda x: x.text ,child[0].select('option'))))
                             option_value_dict = dict(map(lambda x: (x.attrs["value"], x.text), child[0].select('option')))
-                            option_value = self.get_element_value(self.driver.find_element_by_xpath(xpath_soup(child[0])))
+                            option_value = self.get_element_value(self.driver.find_element_by_xpath(self.soup_xpath(child[0])))
                             option_text = next(iter(option_text_list), None)
                             if not option_text:
                                 self.log_error("Couldn't find option")
@@ -3827,7 +3804,7 @@ class WebappInternal(Base):
                                 if field[1] in option_text[0:len(field[1])]:
                                     current_value = field[1]
                             else:
-                                self.send_keys(self.driver.find_element_by_xpath(xpath_soup(child[0])), Keys.ENTER)
+                                self.send_keys(self.driver.find_element_by_xpath(self.soup_xpath(child[0])), Keys.ENTER)
                                 current_value = field[1]
             
             if not check_value:
@@ -3904,7 +3881,7 @@ class WebappInternal(Base):
                     self.log_error(f"{self.language.messages.grid_column_error} Coluna: '{column_name}' Grid: '{headers[field[2]].keys()}'")
 
                 column_number = headers[field[2]][column_name]
-                xpath = xpath_soup(columns[column_number])
+                xpath = self.soup_xpath(columns[column_number])
                 ret = self.get_selenium_column_element(xpath)
 
         return ret
@@ -4061,7 +4038,7 @@ class WebappInternal(Base):
             if row:
                 columns = row.select("td")
                 if columns:
-                    second_column = lambda: self.driver.find_element_by_xpath(xpath_soup(columns[1]))
+                    second_column = lambda: self.driver.find_element_by_xpath(self.soup_xpath(columns[1]))
                     # self.scroll_to_element(second_column())
                     self.driver.execute_script("$('.horizontal-scroll').scrollLeft(-400000);")
                     self.set_element_focus(second_column())
@@ -4137,7 +4114,7 @@ class WebappInternal(Base):
                     if columns:
                         if column_name in headers[grid_number]:
                             column_number = headers[grid_number][column_name]
-                            column_element = lambda : self.driver.find_element_by_xpath(xpath_soup(columns[column_number]))
+                            column_element = lambda : self.driver.find_element_by_xpath(self.soup_xpath(columns[column_number]))
                             if column_element_old_class == None:
                                 column_element_old_class = column_element().get_attribute("class")
 
@@ -4236,6 +4213,8 @@ class WebappInternal(Base):
         #caminho do arquivo csv(SX3)
         path = os.path.join(os.path.dirname(__file__), r'core\\data\\sx3.csv')
 
+        import pandas as pd
+
         #DataFrame para filtrar somente os dados da tabela informada pelo usuário oriundo do csv.
         data = pd.read_csv(path, sep=';', encoding='latin-1', header=None, error_bad_lines=False,
                         index_col='Campo', names=['Campo', 'Tipo', 'Tamanho', 'Titulo', 'Titulo_Spa', 'Titulo_Eng', None], low_memory=False)
@@ -4501,7 +4480,7 @@ class WebappInternal(Base):
                 print("Element found! Waiting for element to be displayed.")
             element = next(iter(self.web_scrap(term=term, scrap_type=scrap_type, optional_term=optional_term, main_container=main_container, check_error=check_error)), None)
             if element is not None:
-                sel_element = lambda: self.driver.find_element_by_xpath(xpath_soup(element))
+                sel_element = lambda: self.driver.find_element_by_xpath(self.soup_xpath(element))
                 endtime = time.time() + timeout
                 while(time.time() < endtime and not self.element_is_displayed(element)):
                     try:
@@ -4534,9 +4513,8 @@ class WebappInternal(Base):
         if filtered_rows:
             return next(iter(filtered_rows))
         else:
-            filtered_rows = list(filter(lambda x: "selected-row" == self.soup_to_selenium(x).get_attribute('class'), rows))
-            if filtered_rows:
-                return next(iter(list(filter(lambda x: "selected-row" == self.soup_to_selenium(x).get_attribute('class'), rows))), None)
+            selenium_rows = self.soups_to_selenium(rows)
+            return next(iter(list(map(lambda x: x[0], filter(lambda x: x[1] and "selected-row" == x[1].get_attribute('class'), zip(rows, selenium_rows))))), None)
 
     def SetFilePath(self, value, button = ""):
         """
@@ -4598,7 +4576,7 @@ class WebappInternal(Base):
             buttons = container[0].select(".ui-button")
             button = list(filter(lambda x: x.text.lower() == button_text.lower(), buttons))
             if button:
-                selenium_button = self.driver.find_element_by_xpath(xpath_soup(button[0]))
+                selenium_button = self.driver.find_element_by_xpath(self.soup_xpath(button[0]))
                 self.click(selenium_button)
 
     def get_enchoice_button_ids(self, layer):
@@ -5124,7 +5102,7 @@ class WebappInternal(Base):
         """
         has_text = False
 
-        element_function = lambda: self.driver.find_element_by_xpath(xpath_soup(element))
+        element_function = lambda: self.driver.find_element_by_xpath(self.soup_xpath(element))
         self.driver.execute_script(f"$(arguments[0]).mouseover()", element_function())
         time.sleep(1)
         tooltips = self.driver.find_elements(By.CSS_SELECTOR, ".ttooltip")
@@ -5157,7 +5135,7 @@ class WebappInternal(Base):
         if not field_soup:
             self.log_error(f"Couldn't find field {field}")
 
-        field_element = lambda: self.driver.find_element_by_xpath(xpath_soup(field_soup))
+        field_element = lambda: self.driver.find_element_by_xpath(self.soup_xpath(field_soup))
 
         success = False
         endtime = time.time() + 60
@@ -5183,7 +5161,7 @@ class WebappInternal(Base):
         >>> self.assert_result(True)
         """
         msg = ""
-        stack_item = next(iter(list(map(lambda x: x.function, filter(lambda x: re.search('test_', x.function), inspect.stack())))), None)
+        stack_item = self.get_test_function()
         test_number = f"{stack_item.split('_')[-1]} -" if stack_item else ""
         log_message = f"{test_number}"
         self.log.set_seconds()
@@ -5194,8 +5172,7 @@ class WebappInternal(Base):
         if self.errors:
             
             if expected:
-                for field_msg in self.errors:
-                    log_message += (" " + field_msg)
+                log_message += " " + " ".join(self.errors)
             else:
                 log_message = ""
             
@@ -5284,7 +5261,7 @@ class WebappInternal(Base):
                 
             labels = container.select("label")
             filtered_labels = list(filter(lambda x: label_name.lower() in x.text.lower(), labels))
-            filtered_labels = list(filter(lambda x: EC.element_to_be_clickable((By.XPATH, xpath_soup(x))), filtered_labels))
+            filtered_labels = list(filter(lambda x: EC.element_to_be_clickable((By.XPATH, self.soup_xpath(x))), filtered_labels))
             label = next(iter(filtered_labels), None)
             
         if not label:
@@ -5757,7 +5734,7 @@ class WebappInternal(Base):
         >>> elements = self.filter_label_element(label_text, container)
         """
         
-        elements = list(map(lambda x: self.find_first_div_parent(x), container.find_all(text=re.compile(f"^{re.escape(label_text)}" + r"([\s\?:\*\.]+)?"))))
+        elements = list(map(lambda x: self.find_first_div_parent(x), container.find_all(text=label_pattern(label_text, r"([\s\?:\*\.]+)?"))))
         return list(filter(lambda x: self.element_is_displayed(x), elements)) if len(elements) > 1 else elements
 
     def filter_is_displayed(self, elements):
@@ -5931,7 +5908,7 @@ class WebappInternal(Base):
 
         if not element and expected_condition != "alert_is_present" : self.log_error("Error method wait_until_to() - element is None")
 
-        element = xpath_soup(element) if locator == By.XPATH else element
+        element = self.soup_xpath(element) if locator == By.XPATH else element
         try:
 
             if locator:
@@ -6138,9 +6115,9 @@ class WebappInternal(Base):
         Returns a list if selenium displayed and enabled methods is True.
         """
         if elements:
-            is_displayed = list(filter(lambda x: self.element_is_displayed(x), elements))
-            
-            return list(filter(lambda x: self.soup_to_selenium(x).is_enabled(), is_displayed))
+            selenium_elements = self.soups_to_selenium(elements)
+
+            return list(map(lambda x: x[0], filter(lambda x: x[1] and x[1].is_displayed() and x[1].is_enabled(), zip(elements, selenium_elements))))
 
     def update_password(self):
         """
@@ -6276,6 +6253,7 @@ class WebappInternal(Base):
         has_header = 'infer' if header else None
         
         if self.config.csv_path:
+            import pandas as pd
             data = pd.read_csv(f"{self.config.csv_path}\\{csv_file}", sep=delimiter, encoding='latin-1', error_bad_lines=False, header=has_header, index_col=False)
             df = pd.DataFrame(data)
             df = df.dropna(axis=1, how='all')